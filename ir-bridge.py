@@ -16,23 +16,30 @@ Environment Variables:
     MQTT_TOPIC: Base MQTT topic (default: home/hsb2/ir-bridge)
     LOG_LEVEL: Logging level (default: INFO)
     DEBOUNCE_MS: Debounce time in milliseconds (default: 100)
+    HOLD_THROTTLE_MS: Min ms between dispatches of a held key (default: 200)
     RETRY_COUNT: HTTP retry attempts (default: 3)
     RETRY_DELAY: Seconds between retries (default: 1.0)
     WEB_PORT: Web UI port (default: 8080)
 """
 
+import array
 import os
 import sys
 import time
 import json
 import logging
+import queue
+import select
 import signal
+import struct
 import threading
 from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 import paho.mqtt.client as mqtt
 
 try:
@@ -47,6 +54,32 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # Rust JSON encoder, 3-10x faster than stdlib on the Pi's ARM11 and
+    # returns bytes directly (paho accepts bytes, skipping one encode)
+    _dumps = orjson.dumps
+elif UJSON_AVAILABLE:
+    # C encoder, still several times faster than stdlib on small dicts
+    def _dumps(obj) -> bytes:
+        """ujson-backed JSON encoder returning bytes (orjson-compatible)."""
+        return ujson.dumps(obj).encode('utf-8')
+else:
+    def _dumps(obj) -> bytes:
+        """Fallback JSON encoder returning bytes (orjson-compatible)."""
+        return json.dumps(obj).encode('utf-8')
+
 # Read version from VERSION file
 def get_version():
     try:
@@ -60,10 +93,19 @@ VERSION = get_version()
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MAPPINGS_FILE = os.path.join(BASE_DIR, 'mappings.json')
 SETTINGS_FILE = os.path.join(BASE_DIR, 'settings.json')
+# Discovered FLIRC device path, cached across restarts (systemd
+# RuntimeDirectory=ir-bridge). Best-effort: missing/stale cache just
+# falls back to a full device scan.
+FLIRC_CACHE_FILE = '/run/ir-bridge/flirc.path'
+
+# struct input_event: struct timeval (two native longs), __u16 type,
+# __u16 code, __s32 value — 16 bytes on the Pi's 32-bit ARM, 24 on 64-bit
+_EV_STRUCT = struct.Struct('llHHi')
+_EV_SIZE = _EV_STRUCT.size
 
 # Try to import evdev, handle gracefully if not available
 try:
-    from evdev import InputDevice, categorize, ecodes
+    from evdev import InputDevice, ecodes
     EVDEV_AVAILABLE = True
 except ImportError:
     EVDEV_AVAILABLE = False
@@ -81,17 +123,43 @@ CONFIG = {
     'mqtt_topic': os.getenv('MQTT_TOPIC', 'home/hsb2/ir-bridge'),
     'log_level': os.getenv('LOG_LEVEL', 'INFO'),
     'debounce_ms': int(os.getenv('DEBOUNCE_MS', '100')),
+    'hold_throttle_ms': int(os.getenv('HOLD_THROTTLE_MS', '200')),
     'retry_count': int(os.getenv('RETRY_COUNT', '3')),
     'retry_delay': float(os.getenv('RETRY_DELAY', '1.0')),
     'web_port': int(os.getenv('WEB_PORT', '8080')),
 }
 
 
+# SOAP envelope halves, already encoded: a body is ENV_PRE + code + ENV_POST
+ENV_PRE = b'''<?xml version="1.0"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+  <s:Body>
+    <u:X_SendIRCC xmlns:u="urn:schemas-sony-com:service:IRCC:1">
+      <IRCCCode>'''
+ENV_POST = b'''</IRCCCode>
+    </u:X_SendIRCC>
+  </s:Body>
+</s:Envelope>'''
+
+
+def build_soap_body(ircc_code: str) -> bytes:
+    """Build the encoded SOAP envelope for an IRCC code."""
+    return ENV_PRE + ircc_code.encode('ascii') + ENV_POST
+
+
 def load_mappings() -> Dict[int, tuple]:
     """Load scancode→IRCC mappings from JSON file.
 
-    Returns dict of scancode -> (command, ircc, debounce_ms, action).
+    Returns dict of scancode ->
+    (command, ircc, debounce_ns, action, body, input_type, key_hex).
     action: 'direct' (send IRCC), 'mqtt' (HA handles), 'disabled'
+    body: pre-encoded SOAP envelope bytes, built once per reload so the
+    hot keypress path skips string formatting and UTF-8 encoding.
+    debounce_ns: per-key debounce converted to nanoseconds at load time,
+    so the key handler compares raw monotonic_ns() values directly.
+    input_type/key_hex: classification and hex() string, precomputed here
+    so known keys pay neither alloc per press; unknown keys still compute
+    them lazily.
     """
     try:
         with open(MAPPINGS_FILE, 'r') as f:
@@ -100,8 +168,13 @@ def load_mappings() -> Dict[int, tuple]:
         for scancode_hex, entry in raw.items():
             scancode = int(scancode_hex, 16)
             debounce = entry.get('debounce_ms')
+            if debounce is not None:
+                debounce *= 1_000_000  # ms -> ns, matching monotonic_ns()
             action = entry.get('action', 'direct')
-            result[scancode] = (entry['command'], entry['ircc'], debounce, action)
+            body = build_soap_body(entry['ircc'])
+            input_type = 'hardware_scancode' if scancode > 1000 else 'linux_keycode'
+            result[scancode] = (entry['command'], entry['ircc'], debounce, action, body,
+                                input_type, hex(scancode))
         return result
     except Exception as e:
         logging.error(f"Failed to load mappings from {MAPPINGS_FILE}: {e}")
@@ -124,13 +197,14 @@ def save_mappings_raw(data: dict):
         f.write('\n')
 
 
+# Environment values seed the defaults; settings.json (web UI) overrides
 SETTINGS_DEFAULTS = {
     'debug_mode': False,
-    'debounce_ms': 100,
-    'hold_throttle_ms': 200,
-    'retry_count': 3,
-    'retry_delay': 1.0,
-    'log_level': 'INFO',
+    'debounce_ms': CONFIG['debounce_ms'],
+    'hold_throttle_ms': CONFIG['hold_throttle_ms'],
+    'retry_count': CONFIG['retry_count'],
+    'retry_delay': CONFIG['retry_delay'],
+    'log_level': CONFIG['log_level'],
     'ha_url': '',
     'ha_token': '',
 }
@@ -153,6 +227,44 @@ def save_settings(data: dict):
         f.write('\n')
 
 
+class BridgeStats:
+    """Runtime counters published on the status topic.
+
+    Slots instead of a dict: the counters are bumped from the key handler
+    and the command worker, and slot attribute writes skip the string-key
+    hashing a dict item set pays. snapshot() rebuilds the dict shape the
+    status payload and /api/status have always had.
+    """
+
+    __slots__ = ('started_at', 'keys_pressed', 'commands_sent', 'errors',
+                 'last_command', 'last_key', 'status', 'updated_at')
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat()
+        self.keys_pressed = 0
+        self.commands_sent = 0
+        self.errors = 0
+        self.last_command = ""
+        self.last_key = ""
+        self.status = 'initializing'
+        self.updated_at = ""
+
+    def snapshot(self) -> dict:
+        """Dict view for JSON serialization (status publish, web UI)."""
+        return {
+            'version': VERSION,
+            'machine': 'hsb2',
+            'started_at': self.started_at,
+            'keys_pressed': self.keys_pressed,
+            'commands_sent': self.commands_sent,
+            'errors': self.errors,
+            'last_command': self.last_command,
+            'last_key': self.last_key,
+            'status': self.status,
+            'updated_at': self.updated_at,
+        }
+
+
 class IRBridge:
     """Main IR Bridge class handling input, TV control, and MQTT."""
 
@@ -161,29 +273,88 @@ class IRBridge:
         self.mqtt_client: Optional[mqtt.Client] = None
         self.input_device: Optional[Any] = None
         self.running = False
-        self.last_key_time: Dict[int, float] = {}
-        self.last_hold_time: Dict[int, float] = {}
+        self._stop_evt = threading.Event()
+        # Debounce timestamps: flat int64 arrays of raw monotonic_ns()
+        # values for Linux keycodes (< 512, single C-level load/store),
+        # dicts for hardware scancodes
+        self._last_key_lin = array.array('q', bytes(512 * 8))
+        self._last_hold_lin = array.array('q', bytes(512 * 8))
+        self.last_key_time: Dict[int, int] = {}
+        self.last_hold_time: Dict[int, int] = {}
         self.ircc_codes: Dict[int, tuple] = {}
+        # Dense lookup table for Linux keycodes (< 512): a list index is a
+        # single C-level deref vs dict hash+probe. Hardware scancodes
+        # (> 0x10000) stay in the dict.
+        self._map_linear: list = [None] * 512
         self.recent_events: deque = deque(maxlen=50)
         self.settings = load_settings()
+        self._rebuild_topics()
+        self._apply_settings()
         self._mappings_mtime: float = 0
-        self.stats = {
-            'version': VERSION,
-            'machine': 'hsb2',
-            'started_at': datetime.now().isoformat(),
-            'keys_pressed': 0,
-            'commands_sent': 0,
-            'errors': 0,
-            'last_command': "",
-            'last_key': "",
-            'status': 'initializing'
-        }
+        self._ts_cache: tuple = (0, '')
+        # Bounded command queue: the evdev loop only enqueues, a single
+        # worker thread does the (potentially slow) HTTP sends. Drop-oldest
+        # on overflow so stale hold events can't pile up behind a slow TV.
+        self._cmd_queue: queue.Queue = queue.Queue(maxsize=8)
+        self._last_status_ms: int = 0
+        # Mutable-field tuple from the last status publish (skip dupes)
+        self._last_status_key: Optional[tuple] = None
+        # (base_topic, [(topic, payload)]) — HA discovery, built lazily
+        self._discovery_cache: tuple = ('', [])
+        # Hold-burst coalescing: publish one summary event per flush window
+        # instead of one event per evdev autorepeat (saves Wi-Fi frames)
+        self._hold_buffer: list = []
+        self._hold_start_ms: int = 0
+        self._last_hold_flush_ms: int = 0
+        # Holds for 'direct' keys buffer on the worker thread but 'mqtt'
+        # keys buffer on the evdev thread — same cross-thread situation
+        # as the press buffer, same lock treatment
+        self._hold_lock = threading.Lock()
+        # Press-event batching: encoded payloads buffered briefly and
+        # published as one JSON array (one Wi-Fi frame per window)
+        self._press_buffer: deque = deque(maxlen=64)
+        self._press_first_ms: int = 0
+        self._press_lock = threading.Lock()
+        # Precompiled event payload template: version, machine and TV IP
+        # are constant for the process lifetime, so _publish_event does a
+        # single bytes %-format instead of building a nested dict and
+        # walking it through the JSON encoder on every keypress. Values
+        # come from mappings.json / our own code, so no JSON escaping is
+        # needed.
+        self._event_tpl = (
+            b'{"timestamp":"%b","version":"' + VERSION.encode('ascii') +
+            b'","machine":"hsb2","event":{"key_name":"%b","key_code":%d,'
+            b'"key_code_hex":%b,"input_type":"%b","command":"%b","success":%b},'
+            b'"target":{"type":"sony_tv","ip":"' + CONFIG['sony_tv_ip'].encode('ascii') + b'"}}'
+        )
+        self.stats = BridgeStats()
+
+        if PSUTIL_AVAILABLE:
+            # Prime the CPU counter: the first cpu_percent(interval=None)
+            # call always returns 0.0, so take the baseline now and the
+            # first health publish reports a real delta
+            psutil.cpu_percent(interval=None)
+        # (monotonic_ms, dict) — disk usage barely moves, cache it
+        self._disk_cache: tuple = (0, None)
 
         # Validate configuration
         if not CONFIG['sony_tv_psk']:
             self.logger.error("SONY_TV_PSK environment variable not set!")
             sys.exit(1)
 
+        # Persistent HTTP session for TV commands — keep-alive avoids a TCP
+        # handshake per keypress (one RTT saved on every button press)
+        self.http = requests.Session()
+        self.http.headers.update({
+            'Content-Type': 'text/xml; charset=UTF-8',
+            'SOAPACTION': '"urn:schemas-sony-com:service:IRCC:1#X_SendIRCC"',
+            'X-Auth-PSK': CONFIG['sony_tv_psk'],
+            'Connection': 'keep-alive'
+        })
+        # max_retries=0: _send_ircc_command has its own retry loop with
+        # configurable delay; urllib3 must not retry underneath it
+        self.http.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+
         # Load mappings
         self._reload_mappings()
 
@@ -193,11 +364,32 @@ class IRBridge:
             mtime = os.path.getmtime(MAPPINGS_FILE)
             if mtime != self._mappings_mtime:
                 self.ircc_codes = load_mappings()
+                # Dense direct-index table for the Linux keycode range:
+                # a list deref beats dict hashing on the per-press path.
+                # Hardware scancodes (all > 0x10000) stay in the dict.
+                linear = [None] * 512
+                for code, entry in self.ircc_codes.items():
+                    if code < 512:
+                        linear[code] = entry
+                self._map_linear = linear
                 self._mappings_mtime = mtime
                 self.logger.info(f"Loaded {len(self.ircc_codes)} mappings from {MAPPINGS_FILE}")
         except Exception as e:
             self.logger.error(f"Failed to reload mappings: {e}")
 
+    def _now_iso(self) -> str:
+        """ISO timestamp with millisecond precision, cheap enough for the hot path.
+
+        datetime.now().isoformat() allocates a datetime and formats it on
+        every call (~10 µs on the Pi Zero). Cache the formatted date prefix
+        per second and only append the milliseconds.
+        """
+        t = time.time()
+        s = int(t)
+        if s != self._ts_cache[0]:
+            self._ts_cache = (s, datetime.fromtimestamp(s).strftime('%Y-%m-%dT%H:%M:%S'))
+        return f"{self._ts_cache[1]}.{int((t - s) * 1000):03d}"
+
     @property
     def mqtt_topic(self) -> str:
         """Return current MQTT topic prefix based on debug mode."""
@@ -209,17 +401,56 @@ class IRBridge:
             return '/'.join(parts)
         return base
 
+    def _apply_settings(self):
+        """Cache hot-path settings as plain int attributes.
+
+        _handle_key runs per input event; two dict .get() calls per event
+        add up during hold bursts. Re-run after the web UI changes settings.
+        """
+        # Stored in nanoseconds so _handle_key compares raw monotonic_ns()
+        # values without a per-event division
+        self._debounce_ns = int(self.settings.get('debounce_ms', 100)) * 1_000_000
+        self._hold_throttle_ns = int(self.settings.get('hold_throttle_ms', 200)) * 1_000_000
+
+    def _rebuild_topics(self):
+        """Precompute the per-channel topic strings.
+
+        The prefix only changes when debug mode flips, so publishes don't
+        need to rebuild f-strings on every event.
+        """
+        base = self.mqtt_topic
+        self._topic_availability = base + '/availability'
+        self._topic_commands = base + '/commands'
+        self._topic_status = base + '/status'
+        self._topic_events = base + '/events'
+        self._topic_raw = base + '/raw'
+        self._topic_health = base + '/health'
+
     def _setup_logging(self) -> logging.Logger:
         """Configure logging."""
         logger = logging.getLogger('ir-bridge')
         logger.setLevel(getattr(logging, CONFIG['log_level'].upper()))
 
+        # Skip per-record metadata we never put in the format string
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         handler = logging.StreamHandler(sys.stdout)
+        # Short datefmt: journald already prefixes a full timestamp, and
+        # strftime on the long default is surprisingly costly on ARM11
         formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        # Decouple logging I/O from the input/command threads: they only
+        # enqueue records, the listener thread does the stdout write()
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(log_queue, handler)
+        self._log_listener.start()
 
         return logger
 
@@ -232,8 +463,15 @@ class IRBridge:
             except ImportError:
                 self.mqtt_client = mqtt.Client()
 
+            # Bound paho's internal buffers so a broker stall can't leak
+            # memory on the Pi Zero; dropped hold/raw events are harmless.
+            # 20/100 rides out a transient Wi-Fi glitch without stalling
+            # event publishes behind unacked messages.
+            self.mqtt_client.max_inflight_messages_set(20)
+            self.mqtt_client.max_queued_messages_set(100)
+
             self.mqtt_client.will_set(
-                f"{self.mqtt_topic}/availability",
+                self._topic_availability,
                 payload="offline",
                 retain=True
             )
@@ -248,10 +486,12 @@ class IRBridge:
             self.mqtt_client.on_disconnect = self._on_mqtt_disconnect
             self.mqtt_client.on_message = self._on_mqtt_message
 
+            # 120 s keepalive halves idle PINGREQ traffic on the Wi-Fi
+            # uplink; the LWT still fires within two keepalive intervals
             self.mqtt_client.connect(
                 CONFIG['mqtt_broker'],
                 CONFIG['mqtt_port'],
-                keepalive=60
+                keepalive=120
             )
 
             self.mqtt_client.loop_start()
@@ -267,16 +507,30 @@ class IRBridge:
         """MQTT connect callback (paho-mqtt v2 compatible)."""
         if rc == 0:
             self.logger.info("MQTT connected successfully")
-            client.subscribe(f"{self.mqtt_topic}/commands")
-            self.mqtt_client.publish(f"{self.mqtt_topic}/availability", "online", retain=True)
+            client.subscribe(self._topic_commands)
+            self.mqtt_client.publish(self._topic_availability, "online", retain=True)
             self._setup_ha_discovery()
-            self._publish_status()
+            self._publish_status(force=True)
         else:
             self.logger.error(f"MQTT connection failed with code {rc}")
 
     def _setup_ha_discovery(self):
-        """Register device and entities in Home Assistant via MQTT Discovery."""
+        """Register device and entities in Home Assistant via MQTT Discovery.
+
+        The six payloads are static per topic prefix, so they're built and
+        serialized once and replayed from cache on every reconnect.
+        """
         base_topic = self.mqtt_topic
+        if self._discovery_cache[0] != base_topic:
+            self._discovery_cache = (base_topic, self._build_discovery_payloads(base_topic))
+
+        for discovery_topic, payload in self._discovery_cache[1]:
+            self.mqtt_client.publish(discovery_topic, payload, retain=True)
+
+        self.logger.info("Home Assistant Discovery payloads published")
+
+    def _build_discovery_payloads(self, base_topic: str) -> list:
+        """Build the (topic, serialized payload) discovery pairs."""
         node_id = "flirc_bridge_hsb2"
         device_info = {
             "identifiers": [node_id],
@@ -344,6 +598,7 @@ class IRBridge:
             }
         ]
 
+        payloads = []
         for entity in entities:
             discovery_topic = f"homeassistant/{entity['type']}/{node_id}/{entity['id']}/config"
             payload = {
@@ -365,9 +620,9 @@ class IRBridge:
                 payload["payload_on"] = entity["payload_on"]
                 payload["payload_off"] = entity["payload_off"]
 
-            self.mqtt_client.publish(discovery_topic, json.dumps(payload), retain=True)
+            payloads.append((discovery_topic, _dumps(payload)))
 
-        self.logger.info("Home Assistant Discovery payloads published")
+        return payloads
 
     def _teardown_ha_discovery(self, topic_prefix: str):
         """Remove HA discovery entities and mark offline for a topic prefix."""
@@ -392,6 +647,7 @@ class IRBridge:
         old_topic = self.mqtt_topic
         self.settings['debug_mode'] = enabled
         save_settings(self.settings)
+        self._rebuild_topics()
         new_topic = self.mqtt_topic
 
         if old_topic != new_topic:
@@ -403,7 +659,7 @@ class IRBridge:
                 # Back to production — re-register HA discovery
                 self._setup_ha_discovery()
             self.mqtt_client.subscribe(f"{new_topic}/commands")
-            self._publish_status()
+            self._publish_status(force=True)
 
         self.logger.info(f"Debug mode {'ON' if enabled else 'OFF'} — topic: {new_topic}")
 
@@ -419,7 +675,7 @@ class IRBridge:
 
             if topic.endswith('/commands'):
                 if payload == 'status':
-                    self._publish_status()
+                    self._publish_status(force=True)
                 elif payload == 'restart':
                     self.logger.info("Restart requested via MQTT")
                     self.stop()
@@ -427,67 +683,172 @@ class IRBridge:
         except Exception as e:
             self.logger.error(f"Error handling MQTT message: {e}")
 
-    def _publish_status(self):
-        """Publish current status to MQTT."""
+    def _publish_status(self, force: bool = False):
+        """Publish current status to MQTT.
+
+        Skipped when nothing changed since the last publish — the broker
+        retains the previous snapshot, so republishing identical state
+        just wakes the Wi-Fi radio. force bypasses the check (explicit
+        status requests, topic switches, broker reconnects).
+        """
         if not self.mqtt_client:
             return
 
         try:
-            self.stats['status'] = 'running' if self.running else 'stopped'
-            self.stats['updated_at'] = datetime.now().isoformat()
-
+            s = self.stats
+            s.status = 'running' if self.running else 'stopped'
+            key = (s.keys_pressed, s.commands_sent, s.errors,
+                   s.last_key, s.last_command, s.status)
+            if not force and key == self._last_status_key:
+                return
+            self._last_status_key = key
+            s.updated_at = self._now_iso()
+
+            # qos=0: retained snapshot, no ack round-trip; the next
+            # publish supersedes a lost one anyway
             self.mqtt_client.publish(
-                f"{self.mqtt_topic}/status",
-                json.dumps(self.stats),
+                self._topic_status,
+                _dumps(self.stats.snapshot()),
+                qos=0,
                 retain=True
             )
+            self._last_status_ms = time.monotonic_ns() // 1_000_000
 
             self.logger.debug("Status published to MQTT")
 
         except Exception as e:
             self.logger.error(f"Failed to publish status: {e}")
 
-    def _publish_event(self, key_name: str, key_code: int, command_name: str, success: bool, input_type: str):
-        """Publish key event to MQTT."""
+    HOLD_FLUSH_MS = 500  # max one hold summary publish per window
+    PRESS_FLUSH_MS = 200  # max one press-batch publish per window
+
+    def _publish_event(self, key_name: str, key_code: int, command_name: str, success: bool, input_type: str, is_hold: bool = False, key_hex: str = None):
+        """Queue key event for MQTT publishing.
+
+        Hold repeats are coalesced: only a summary event is published at
+        most every HOLD_FLUSH_MS, so a held button doesn't flood the
+        Pi Zero's Wi-Fi uplink with one small frame per autorepeat.
+        Distinct presses are batched too: events landing within
+        PRESS_FLUSH_MS go out as one JSON array publish (fewer radio
+        wakeups); stragglers are flushed by the command worker's wakeup.
+        """
         if not self.mqtt_client:
             return
 
+        if is_hold:
+            now_ms = time.monotonic_ns() // 1_000_000
+            with self._hold_lock:
+                if not self._hold_buffer:
+                    self._hold_start_ms = now_ms
+                self._hold_buffer.append((key_name, success))
+                flush = now_ms - self._last_hold_flush_ms > self.HOLD_FLUSH_MS
+            if flush:
+                self._flush_hold_batch(now_ms)
+            return
+
+        # Distinct press: flush any pending hold summary first, then
+        # batch the event
+        if self._hold_buffer:
+            self._flush_hold_batch(time.monotonic_ns() // 1_000_000)
+
         try:
-            event = {
-                'timestamp': datetime.now().isoformat(),
-                'version': VERSION,
-                'machine': 'hsb2',
-                'event': {
-                    'key_name': key_name,
-                    'key_code': key_code,
-                    'key_code_hex': hex(key_code) if key_code > 1000 else None,
-                    'input_type': input_type,
-                    'command': command_name,
-                    'success': success
-                },
-                'target': {
-                    'type': 'sony_tv',
-                    'ip': CONFIG['sony_tv_ip']
-                }
+            if key_code > 1000:
+                # key_hex arrives precomputed from the mapping table
+                if key_hex is None:
+                    key_hex = hex(key_code)
+                hex_b = b'"' + key_hex.encode('ascii') + b'"'
+            else:
+                hex_b = b'null'
+
+            payload = self._event_tpl % (
+                self._now_iso().encode('ascii'),
+                key_name.encode('ascii'),
+                key_code,
+                hex_b,
+                input_type.encode('ascii'),
+                command_name.encode('ascii'),
+                b'true' if success else b'false'
+            )
+
+            now_ms = time.monotonic_ns() // 1_000_000
+            with self._press_lock:
+                if not self._press_buffer:
+                    self._press_first_ms = now_ms
+                self._press_buffer.append(payload)
+                full = len(self._press_buffer) == self._press_buffer.maxlen
+            if full or now_ms - self._press_first_ms >= self.PRESS_FLUSH_MS:
+                self._flush_press_batch()
+
+        except Exception as e:
+            self.logger.error(f"Failed to publish event: {e}")
+
+    def _flush_press_batch(self):
+        """Publish the buffered press events as one JSON array."""
+        with self._press_lock:
+            if not self._press_buffer:
+                return
+            payload = b'[' + b','.join(self._press_buffer) + b']'
+            self._press_buffer.clear()
+        try:
+            self.mqtt_client.publish(self._topic_events, payload, qos=0)
+        except Exception as e:
+            self.logger.error(f"Failed to publish press batch: {e}")
+
+    def _flush_stale_batches(self):
+        """Flush press/hold batches past their windows (worker wakeup).
+
+        Without this the tail of a hold burst would sit buffered until
+        the next keypress — possibly hours later, with a fresh timestamp.
+        """
+        now_ms = time.monotonic_ns() // 1_000_000
+        if self._press_buffer and now_ms - self._press_first_ms >= self.PRESS_FLUSH_MS:
+            self._flush_press_batch()
+        if self._hold_buffer and now_ms - self._last_hold_flush_ms > self.HOLD_FLUSH_MS:
+            self._flush_hold_batch(now_ms)
+
+    def _flush_hold_batch(self, now_ms: int):
+        """Publish one summary event for the buffered hold repeats."""
+        with self._hold_lock:
+            if not self._hold_buffer:
+                return
+            key_name, _ = self._hold_buffer[-1]
+            count = len(self._hold_buffer)
+            span_ms = int(now_ms - self._hold_start_ms)
+            success = all(s for _, s in self._hold_buffer)
+            self._hold_buffer.clear()
+            self._last_hold_flush_ms = now_ms
+
+        batch = {
+            'timestamp': self._now_iso(),
+            'version': VERSION,
+            'machine': 'hsb2',
+            'event': {
+                'type': 'hold_batch',
+                'key_name': key_name,
+                'count': count,
+                'span_ms': span_ms,
+                'success': success
             }
+        }
 
+        try:
             self.mqtt_client.publish(
-                f"{self.mqtt_topic}/events",
-                json.dumps(event)
+                self._topic_events,
+                _dumps(batch),
+                qos=0
             )
-
         except Exception as e:
-            self.logger.error(f"Failed to publish event: {e}")
+            self.logger.error(f"Failed to publish hold batch: {e}")
 
-    def _publish_raw_key(self, key_code: int, input_type: str, mapped: bool, command_name: str = None):
+    def _publish_raw_key(self, key_code: int, input_type: str, mapped: bool, command_name: str = None, key_hex: str = None):
         """Publish raw key event to MQTT and store for web UI."""
         event = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
             'version': VERSION,
             'machine': 'hsb2',
             'key': {
                 'key_code': key_code,
-                'key_code_hex': hex(key_code),
+                'key_code_hex': key_hex if key_hex is not None else hex(key_code),
                 'input_type': input_type,
                 'command': command_name,
                 'mapped': mapped,
@@ -502,52 +863,45 @@ class IRBridge:
 
         try:
             self.mqtt_client.publish(
-                f"{self.mqtt_topic}/raw",
-                json.dumps(event)
+                self._topic_raw,
+                _dumps(event),
+                qos=0
             )
 
             if not mapped:
-                self.logger.info(f"Published unmapped key {key_code} to MQTT")
+                self.logger.info("Published unmapped key %d to MQTT", key_code)
 
         except Exception as e:
             self.logger.error(f"Failed to publish raw key: {e}")
 
-    def _send_ircc_command(self, ircc_code: str, command_name: str) -> bool:
-        """Send IRCC command to Sony TV."""
+    def _send_ircc_command(self, ircc_code: str, command_name: str, body: bytes = None) -> bool:
+        """Send IRCC command to Sony TV.
+
+        body: pre-encoded SOAP envelope from the mappings table; built on
+        the fly for ad-hoc codes (web UI test button).
+        """
         url = f"http://{CONFIG['sony_tv_ip']}/sony/IRCC"
-        headers = {
-            'Content-Type': 'text/xml; charset=UTF-8',
-            'SOAPACTION': '"urn:schemas-sony-com:service:IRCC:1#X_SendIRCC"',
-            'X-Auth-PSK': CONFIG['sony_tv_psk']
-        }
 
-        body = f'''<?xml version="1.0"?>
-<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
-  <s:Body>
-    <u:X_SendIRCC xmlns:u="urn:schemas-sony-com:service:IRCC:1">
-      <IRCCCode>{ircc_code}</IRCCCode>
-    </u:X_SendIRCC>
-  </s:Body>
-</s:Envelope>'''
+        if body is None:
+            body = build_soap_body(ircc_code)
 
         retry_count = self.settings.get('retry_count', 3)
         retry_delay = self.settings.get('retry_delay', 1.0)
 
         for attempt in range(retry_count):
             try:
-                response = requests.post(
+                response = self.http.post(
                     url,
-                    headers=headers,
                     data=body,
-                    timeout=5
+                    timeout=(1.0, 5.0)  # (connect, read): fail fast on a dead TV
                 )
 
                 if response.status_code == 200:
-                    self.logger.debug(f"Command sent successfully: {command_name}")
+                    self.logger.debug("Command sent successfully: %s", command_name)
                     return True
                 else:
                     self.logger.warning(
-                        f"Command failed with status {response.status_code}: {command_name}"
+                        "Command failed with status %d: %s", response.status_code, command_name
                     )
 
             except requests.exceptions.RequestException as e:
@@ -560,94 +914,155 @@ class IRBridge:
 
     def _handle_key(self, key_code: int, is_hold: bool = False):
         """Handle a key press event."""
-        now = time.time() * 1000  # ms
-        input_type = 'hardware_scancode' if key_code > 1000 else 'linux_keycode'
+        now = time.monotonic_ns()  # raw ns, immune to wall-clock jumps
 
         # Check for mapping changes
         self._reload_mappings()
 
-        # Get per-key debounce and action if mapped
-        per_key_debounce = None
-        per_key_action = 'direct'
-        if key_code in self.ircc_codes:
-            _, _, per_key_debounce, per_key_action = self.ircc_codes[key_code]
+        # Single lookup: dense table for Linux keycodes, dict for scancodes
+        # Lower bound guards against a negative code reaching us (e.g. an
+        # unmasked signed scancode) and silently wrapping the list/array
+        # indexes below
+        is_lin = 0 <= key_code < 512
+        if is_lin:
+            entry = self._map_linear[key_code]
+        else:
+            entry = self.ircc_codes.get(key_code)
+
+        # Get per-key debounce if mapped (full unpack happens after debounce)
+        per_key_debounce = entry[2] if entry is not None else None
 
-        # Throttling for held buttons
-        hold_throttle = self.settings.get('hold_throttle_ms', 200)
+        # Throttling for held buttons (all thresholds precomputed in ns)
+        hold_throttle = self._hold_throttle_ns
         # Per-key debounce also suppresses hold events (e.g. power must not repeat)
         if per_key_debounce is not None:
             hold_throttle = max(hold_throttle, per_key_debounce)
 
+        # Debounce semantics: accept immediately, suppress repeats. The
+        # first press of a key always fires with zero added latency; only
+        # repeats inside the window are swallowed. Suppressed events do
+        # NOT refresh the window, so a deliberate double-click's second
+        # press lands as soon as the window expires.
+        # 0 in the arrays means "never seen" — the monotonic clock is far
+        # past 0 by the time we run
         if is_hold:
-            if key_code in self.last_hold_time:
-                elapsed_hold = now - self.last_hold_time[key_code]
-                if elapsed_hold < hold_throttle:
-                    return
-            self.last_hold_time[key_code] = now
+            prev = self._last_hold_lin[key_code] if is_lin else self.last_hold_time.get(key_code, 0)
+            if prev and now - prev < hold_throttle:
+                return
+            if is_lin:
+                self._last_hold_lin[key_code] = now
+            else:
+                self.last_hold_time[key_code] = now
         else:
             # Per-key debounce overrides global
-            debounce_limit = per_key_debounce if per_key_debounce is not None else self.settings.get('debounce_ms', 100)
+            debounce_limit = per_key_debounce if per_key_debounce is not None else self._debounce_ns
 
-            if key_code in self.last_key_time:
-                elapsed = now - self.last_key_time[key_code]
-                if elapsed < debounce_limit:
-                    return
+            prev = self._last_key_lin[key_code] if is_lin else self.last_key_time.get(key_code, 0)
+            if prev and now - prev < debounce_limit:
+                return
 
-            self.last_key_time[key_code] = now
-            self.last_hold_time[key_code] = now
+            if is_lin:
+                self._last_key_lin[key_code] = now
+                self._last_hold_lin[key_code] = now
+            else:
+                self.last_key_time[key_code] = now
+                self.last_hold_time[key_code] = now
 
         # Lookup command
-        if key_code not in self.ircc_codes:
-            self.logger.info(f"Unknown {input_type}: {key_code} ({hex(key_code)})")
+        if entry is None:
+            input_type = 'hardware_scancode' if key_code > 1000 else 'linux_keycode'
+            self.logger.info("Unknown %s: %d (%#x)", input_type, key_code, key_code)
             self._publish_raw_key(key_code, input_type, mapped=False)
             return
 
-        command_name, ircc_code, _, action = self.ircc_codes[key_code]
+        command_name, ircc_code, _, action, body, input_type, key_hex = entry
 
         if action == 'disabled':
-            self.logger.debug(f"Disabled key: {command_name} ({input_type}: {key_code})")
-            self._publish_raw_key(key_code, input_type, mapped=True, command_name=command_name)
+            self.logger.debug("Disabled key: %s (%s: %d)", command_name, input_type, key_code)
+            self._publish_raw_key(key_code, input_type, mapped=True, command_name=command_name, key_hex=key_hex)
             return
 
         if is_hold:
-            self.logger.debug(f"Key held: {command_name} ({input_type}: {key_code})")
+            self.logger.debug("Key held: %s (%s: %d)", command_name, input_type, key_code)
         else:
-            self.logger.info(f"Key pressed: {command_name} [{action}] ({input_type}: {key_code})")
+            self.logger.info("Key pressed: %s [%s] (%s: %d)", command_name, action, input_type, key_code)
 
-        self.stats['keys_pressed'] += 1
-        self.stats['last_key'] = command_name
+        self.stats.keys_pressed += 1
+        self.stats.last_key = command_name
 
         # Publish raw key for all presses
-        self._publish_raw_key(key_code, input_type, mapped=True, command_name=command_name)
+        self._publish_raw_key(key_code, input_type, mapped=True, command_name=command_name, key_hex=key_hex)
 
         if action == 'mqtt':
             # Don't send IRCC — HA handles this via MQTT
-            self._publish_event(command_name, key_code, command_name, True, input_type)
+            self._publish_event(command_name, key_code, command_name, True, input_type, is_hold, key_hex)
             self._publish_status()
             return
 
-        # action == 'direct': send to TV in background thread
-        threading.Thread(
-            target=self._send_and_report,
-            args=(ircc_code, command_name, key_code, input_type),
-            daemon=True
-        ).start()
+        # action == 'direct': hand off to the command worker, never block
+        # the evdev loop on HTTP
+        item = (ircc_code, command_name, key_code, input_type, body, is_hold, key_hex)
+        try:
+            self._cmd_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._cmd_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._cmd_queue.put_nowait(item)
 
-    def _send_and_report(self, ircc_code: str, command_name: str, key_code: int, input_type: str):
-        """Send IRCC command and update stats/events (runs in background thread)."""
+    def _command_worker(self):
+        """Drain the command queue and send IRCC commands (worker thread)."""
+        while self.running:
+            try:
+                item = self._cmd_queue.get(timeout=0.5)
+            except queue.Empty:
+                item = None
+            if item is not None:  # None = shutdown sentinel from stop()
+                # Guard the whole body: an unexpected exception here would
+                # kill the only sender thread while the bridge still looks
+                # healthy (status keeps publishing)
+                try:
+                    # Hold bursts enqueue the same command faster than the
+                    # TV ingests it; collapse consecutive duplicate *hold*
+                    # events (same IRCC code) and send only the newest.
+                    # Distinct presses are never eaten — five deliberate
+                    # volume taps must reach the TV as five steps even if
+                    # a slow send let them queue up. Safe peek: this
+                    # worker is the only consumer.
+                    dropped = 0
+                    while item[5]:
+                        with self._cmd_queue.mutex:
+                            head = self._cmd_queue.queue[0] if self._cmd_queue.queue else None
+                        if head is None or head[0] != item[0] or not head[5]:
+                            break
+                        item = self._cmd_queue.get_nowait()
+                        dropped += 1
+                    if dropped:
+                        self.logger.debug("Coalesced %d duplicate %s holds", dropped, item[1])
+                    self._send_and_report(*item)
+                except Exception as e:
+                    self.logger.error(f"Command worker error: {e}")
+                    self.stats.errors += 1
+            # Push out any press/hold batch that aged past its flush
+            # window while the queue sat idle
+            self._flush_stale_batches()
+
+    def _send_and_report(self, ircc_code: str, command_name: str, key_code: int, input_type: str, body: bytes = None, is_hold: bool = False, key_hex: str = None):
+        """Send IRCC command and update stats/events (runs on the worker thread)."""
         if self.settings.get('debug_mode', False):
-            self.logger.info(f"Debug mode: suppressed {command_name} (not sent to TV)")
+            self.logger.info("Debug mode: suppressed %s (not sent to TV)", command_name)
             success = True  # pretend success for stats
         else:
-            success = self._send_ircc_command(ircc_code, command_name)
+            success = self._send_ircc_command(ircc_code, command_name, body)
 
         if success:
-            self.stats['commands_sent'] += 1
-            self.stats['last_command'] = command_name
+            self.stats.commands_sent += 1
+            self.stats.last_command = command_name
         else:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
 
-        self._publish_event(command_name, key_code, command_name, success, input_type)
+        self._publish_event(command_name, key_code, command_name, success, input_type, is_hold, key_hex)
         self._publish_status()
 
     def _setup_input(self) -> bool:
@@ -659,18 +1074,55 @@ class IRBridge:
         try:
             device_path = CONFIG['flirc_device']
 
-            from evdev import list_devices
-            devices = [InputDevice(path) for path in list_devices()]
+            # Fast path: reuse the cached path from the last discovery
+            # (systemd restarts us frequently; a full scan opens every
+            # /dev/input/event* device)
+            cached_path = self._read_flirc_cache()
+            if cached_path:
+                try:
+                    device = InputDevice(cached_path)
+                    if 'flirc' in device.name.lower():
+                        self.input_device = device
+                        self.logger.info(f"Reusing cached FLIRC device: {device.name}")
+                        self.logger.info(f"Device path: {cached_path}")
+                        return True
+                    device.close()
+                except OSError:
+                    pass  # unplugged or renumbered — rescan below
+
+            # Try the configured path before enumerating: one open + name
+            # ioctl instead of touching every /dev/input/event* device
+            try:
+                device = InputDevice(device_path)
+                if 'flirc' in device.name.lower():
+                    self.input_device = device
+                    self._write_flirc_cache(device_path)
+                    self.logger.info(f"Using configured FLIRC device: {device.name}")
+                    self.logger.info(f"Device path: {device_path}")
+                    return True
+                device.close()
+            except OSError:
+                pass  # not present — scan below
 
-            flirc_devices = [d for d in devices if 'flirc' in d.name.lower()]
+            from evdev import list_devices
+            target_device = None
+            for path in list_devices():
+                d = InputDevice(path)
+                if target_device is None and 'flirc' in d.name.lower():
+                    target_device = d
+                else:
+                    # Every open device holds an fd; release the ones we
+                    # aren't keeping
+                    d.close()
 
-            if flirc_devices:
-                target_device = flirc_devices[0]
+            if target_device:
                 self.input_device = target_device
+                self._write_flirc_cache(target_device.path)
                 self.logger.info(f"Auto-discovered FLIRC device: {target_device.name}")
                 self.logger.info(f"Device path: {target_device.path}")
                 return True
 
+            # Last resort: the configured path as-is, whatever its name
             self.input_device = InputDevice(device_path)
             self.logger.info(f"Using configured input device: {self.input_device.name}")
             self.logger.info(f"Device path: {device_path}")
@@ -680,13 +1132,29 @@ class IRBridge:
             self.logger.error(f"Failed to setup input device: {e}")
             return False
 
+    def _read_flirc_cache(self) -> Optional[str]:
+        """Return the cached FLIRC device path, or None."""
+        try:
+            with open(FLIRC_CACHE_FILE, 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_flirc_cache(self, path: str):
+        """Cache the discovered FLIRC device path (best-effort)."""
+        try:
+            with open(FLIRC_CACHE_FILE, 'w') as f:
+                f.write(path + '\n')
+        except OSError:
+            pass  # /run/ir-bridge missing (e.g. run outside systemd)
+
     def _read_input(self):
         """Read and process input events."""
         if not EVDEV_AVAILABLE or not self.input_device:
             self.logger.warning("Input device not available, simulating...")
             while self.running:
                 self._publish_status()
-                time.sleep(30)
+                self._stop_evt.wait(30)
             return
 
         try:
@@ -694,38 +1162,64 @@ class IRBridge:
 
             scancode = None
             last_scancode = {}  # linux_keycode -> hardware_scancode
-            for event in self.input_device.read_loop():
-                if not self.running:
-                    break
-
-                # Capture MSC_SCAN (arrives before EV_KEY for key_down)
-                if event.type == ecodes.EV_MSC and event.code == ecodes.MSC_SCAN:
-                    scancode = event.value
-                    self.logger.debug(f"Hardware Scancode received: {hex(scancode)}")
-
-                # Process key press and hold events
-                if event.type == ecodes.EV_KEY:
-                    key_event = categorize(event)
-                    linux_code = key_event.scancode
-
-                    if scancode is not None:
-                        target_code = scancode
-                        last_scancode[linux_code] = scancode
-                        scancode = None
-                    elif linux_code in last_scancode:
-                        target_code = last_scancode[linux_code]
-                    else:
-                        target_code = linux_code
-
-                    if key_event.keystate == key_event.key_down:
-                        self.logger.info(f"Input: Code {hex(target_code)} ({key_event.keycode})")
-                        self._handle_key(target_code, is_hold=False)
-                    elif key_event.keystate == key_event.key_hold:
-                        self._handle_key(target_code, is_hold=True)
+            fd = self.input_device.fd
+            # Local bindings: no module-attribute lookups per event
+            ev_msc = ecodes.EV_MSC
+            msc_scan = ecodes.MSC_SCAN
+            ev_key = ecodes.EV_KEY
+            unpack_from = _EV_STRUCT.unpack_from
+            while self.running:
+                # Wait for readiness, then drain everything queued in the
+                # kernel ring in one batch — events can't back up behind a
+                # slow loop body the way one-at-a-time read_loop() allows
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready:
+                    continue
+
+                try:
+                    data = os.read(fd, _EV_SIZE * 64)
+                except BlockingIOError:
+                    continue
+
+                # Decode raw input_event structs directly — evdev's
+                # InputEvent/categorize() allocate objects and do keycode
+                # name lookups per event, wasted work during hold bursts
+                for off in range(0, len(data) - _EV_SIZE + 1, _EV_SIZE):
+                    _, _, etype, code, value = unpack_from(data, off)
+
+                    # Capture MSC_SCAN (arrives before EV_KEY for key_down).
+                    # The struct decodes value as signed __s32; mask back
+                    # to unsigned so scancodes >= 0x80000000 don't arrive
+                    # negative and wrap into the dense lookup tables
+                    if etype == ev_msc and code == msc_scan:
+                        scancode = value & 0xFFFFFFFF
+                        # %#x defers the hex formatting until the record
+                        # is actually emitted (this fires per event pair)
+                        self.logger.debug("Hardware Scancode received: %#x", scancode)
+
+                    # Process key press (1) and hold (2) events; 0 = key up
+                    elif etype == ev_key and value in (1, 2):
+                        if scancode is not None:
+                            target_code = scancode
+                            last_scancode[code] = scancode
+                            scancode = None
+                        elif code in last_scancode:
+                            target_code = last_scancode[code]
+                        else:
+                            target_code = code
+
+                        if value == 1:
+                            self.logger.info("Input: Code %#x (key %d)", target_code, code)
+                            self._handle_key(target_code, is_hold=False)
+                        else:
+                            self._handle_key(target_code, is_hold=True)
 
         except Exception as e:
-            self.logger.error(f"Input read error: {e}")
-            self.stats['errors'] += 1
+            # stop() closes the device to break us out of select(); that's
+            # a clean shutdown, not an input error
+            if self.running:
+                self.logger.error(f"Input read error: {e}")
+                self.stats.errors += 1
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
@@ -778,6 +1272,7 @@ class IRBridge:
             for key in ('debounce_ms', 'hold_throttle_ms', 'retry_count', 'retry_delay', 'log_level', 'ha_url', 'ha_token'):
                 if key in data:
                     bridge.settings[key] = data[key]
+            bridge._apply_settings()
             # Apply log level if changed
             if 'log_level' in data:
                 bridge.logger.setLevel(getattr(logging, str(data['log_level']).upper(), logging.INFO))
@@ -807,7 +1302,7 @@ class IRBridge:
 
         @app.route('/api/status')
         def api_status():
-            return jsonify(bridge.stats)
+            return jsonify(bridge.stats.snapshot())
 
         @app.route('/api/ha-scan', methods=['POST'])
         def api_ha_scan():
@@ -888,17 +1383,17 @@ class IRBridge:
             sys.exit(1)
 
         self.running = True
-        self.stats['status'] = 'running'
+        self.stats.status = 'running'
 
         # Publish initial status
         self._publish_status()
 
         # Start background loops
-        status_thread = threading.Thread(target=self._status_loop, daemon=True)
-        status_thread.start()
+        worker_thread = threading.Thread(target=self._command_worker, daemon=True)
+        worker_thread.start()
 
-        health_thread = threading.Thread(target=self._health_loop, daemon=True)
-        health_thread.start()
+        telemetry_thread = threading.Thread(target=self._telemetry_loop, daemon=True)
+        telemetry_thread.start()
 
         # Start web UI
         self._setup_web()
@@ -911,28 +1406,31 @@ class IRBridge:
                 self._read_input()
             except Exception as e:
                 self.logger.error(f"Error in input loop: {e}")
-                self.stats['errors'] += 1
+                self.stats.errors += 1
 
                 if self.running:
                     self.logger.info("Restarting input loop in 5 seconds...")
-                    time.sleep(5)
+                    if self._stop_evt.wait(5):
+                        break
 
-    def _status_loop(self):
-        """Background thread to periodically publish status."""
-        while self.running:
-            self._publish_status()
-            time.sleep(60)
+    def _telemetry_loop(self):
+        """Single background thread for all periodic publishes.
 
-    def _health_loop(self):
-        """Background thread to periodically publish system health."""
+        Health goes out every interval; status only when no key press
+        refreshed it in the meantime. One thread, one wakeup per minute —
+        the Pi Zero W has a single core, so idle timer threads aren't free.
+        """
         while self.running:
             self._publish_health()
-            time.sleep(60)
+            now_ms = time.monotonic_ns() // 1_000_000
+            if now_ms - self._last_status_ms > 60_000:
+                self._publish_status()
+            self._stop_evt.wait(60)
 
     def _get_system_health(self) -> Dict[str, Any]:
         """Gather system metrics using psutil."""
         health = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
             'version': VERSION,
             'machine': 'hsb2',
             'cpu': {},
@@ -955,12 +1453,19 @@ class IRBridge:
                     'percent_used': mem.percent
                 }
 
-                disk = psutil.disk_usage('/')
-                health['disk'] = {
-                    'total_gb': round(disk.total / (1024**3), 1),
-                    'used_gb': round(disk.used / (1024**3), 1),
-                    'percent_used': disk.percent
-                }
+                # disk_usage statfs's the root fs; the numbers change so
+                # slowly that a 10-minute cache loses nothing
+                cached_at, disk_info = self._disk_cache
+                now_ms = time.monotonic_ns() // 1_000_000
+                if disk_info is None or now_ms - cached_at > 600_000:
+                    disk = psutil.disk_usage('/')
+                    disk_info = {
+                        'total_gb': round(disk.total / (1024**3), 1),
+                        'used_gb': round(disk.used / (1024**3), 1),
+                        'percent_used': disk.percent
+                    }
+                    self._disk_cache = (now_ms, disk_info)
+                health['disk'] = disk_info
 
                 health['uptime_seconds'] = int(time.time() - psutil.boot_time())
             else:
@@ -979,8 +1484,9 @@ class IRBridge:
         try:
             health = self._get_system_health()
             self.mqtt_client.publish(
-                f"{self.mqtt_topic}/health",
-                json.dumps(health),
+                self._topic_health,
+                _dumps(health),
+                qos=0,
                 retain=False
             )
         except Exception as e:
@@ -990,18 +1496,43 @@ class IRBridge:
         """Stop the IR bridge."""
         self.logger.info("Stopping IR bridge...")
         self.running = False
-        self.stats['status'] = 'stopped'
+        self._stop_evt.set()
+        # Wake the command worker immediately instead of letting it ride
+        # out its 0.5 s queue timeout
+        try:
+            self._cmd_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        # Closing the device fd fails the blocked select() in _read_input
+        # right away instead of letting it ride out its 1 s timeout
+        if self.input_device:
+            try:
+                self.input_device.close()
+            except Exception:
+                pass
+        self.stats.status = 'stopped'
 
-        # Publish final status
+        # Publish buffered events and final status
+        if self.mqtt_client:
+            self._flush_hold_batch(time.monotonic_ns() // 1_000_000)
+            self._flush_press_batch()
         self._publish_status()
 
-        # Cleanup
+        # Cleanup. The LWT only covers ungraceful disconnects (power loss,
+        # crash) — on a clean shutdown we must publish offline ourselves or
+        # the retained availability stays 'online' forever.
         if self.mqtt_client:
+            self.mqtt_client.publish(self._topic_availability, "offline", retain=True)
             self.mqtt_client.loop_stop()
             self.mqtt_client.disconnect()
 
         self.logger.info("IR bridge stopped")
 
+        # Flush queued log records and stop the listener thread last
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
 
 def main():
     """Main entry point."""